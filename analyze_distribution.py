@@ -4,8 +4,40 @@
 import pandas as pd
 import numpy as np
 
-# Load dataset
-df = pd.read_csv('dbx/synthetic_data/output/synthetic_data_v1.csv')
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # fastparquet reads the schema instead
+    pq = None
+    from fastparquet import ParquetFile
+
+DATA_PATH = 'dbx/synthetic_data/output/synthetic_data_v1.parquet'
+COLUMNS = ['Provider_Type', 'Risk_Score', 'Claim_Amount', 'Adverse_Actions', 'Board_Certification',
+           'Reassignment_Of_Benefits', 'License_State', 'Specialty_Code', 'Billing_Agency',
+           'SSN', 'ssn_ein', 'BANK', 'Enrollment_Date', 'Gender', 'Ownership_Type']
+# Low-cardinality columns aggregate on integer codes instead of hashing strings
+CATEGORICAL_COLUMNS = ['Provider_Type', 'Adverse_Actions', 'Board_Certification', 'Reassignment_Of_Benefits',
+                       'License_State', 'Specialty_Code', 'Ownership_Type', 'Gender']
+
+
+def report(counts, total, width=20):
+    """Print each value with its count and percentage of total"""
+    values = counts.to_numpy()
+    pct = values / total * 100
+    for key, count, share in zip(counts.index, values, pct):
+        print(f"   {str(key):{width}s}: {count:8,} ({share:5.2f}%)")
+
+
+# Load only the columns the report uses
+df = pd.read_parquet(DATA_PATH, columns=COLUMNS)
+if pq is not None:
+    total_columns = len(pq.read_schema(DATA_PATH).names)
+else:
+    total_columns = len(ParquetFile(DATA_PATH).columns)
+
+# The generator writes these dictionary-encoded, so this is a no-op for its output
+for col in CATEGORICAL_COLUMNS:
+    if not isinstance(df[col].dtype, pd.CategoricalDtype):
+        df[col] = df[col].astype('category')
 
 print("="*70)
 print("SYNTHETIC HEALTHCARE DATASET DISTRIBUTION ANALYSIS")
@@ -13,12 +45,11 @@ print("="*70)
 
 print(f"\n1. DATASET SIZE:")
 print(f"   Total records: {len(df):,}")
-print(f"   Total columns: {len(df.columns)}")
+print(f"   Total columns: {total_columns}")
 
 print(f"\n2. PROVIDER TYPE DISTRIBUTION:")
 provider_dist = df['Provider_Type'].value_counts()
-for ptype, count in provider_dist.items():
-    print(f"   {ptype:20s}: {count:8,} ({count/len(df)*100:5.2f}%)")
+report(provider_dist, len(df))
 
 print(f"\n3. RISK SCORE DISTRIBUTION:")
 risk_dist = df['Risk_Score'].value_counts().sort_index()
@@ -26,39 +57,36 @@ for risk, count in risk_dist.items():
     print(f"   Risk Score {risk:2d}: {count:8,} ({count/len(df)*100:5.2f}%)")
 
 print(f"\n4. CLAIM AMOUNT STATISTICS:")
-print(f"   Mean:       ${df['Claim_Amount'].mean():,.2f}")
-print(f"   Median:     ${df['Claim_Amount'].median():,.2f}")
-print(f"   Std Dev:    ${df['Claim_Amount'].std():,.2f}")
-print(f"   Min:        ${df['Claim_Amount'].min():,.2f}")
-print(f"   Max:        ${df['Claim_Amount'].max():,.2f}")
-print(f"   25th pct:   ${df['Claim_Amount'].quantile(0.25):,.2f}")
-print(f"   75th pct:   ${df['Claim_Amount'].quantile(0.75):,.2f}")
-print(f"   95th pct:   ${df['Claim_Amount'].quantile(0.95):,.2f}")
+claim_stats = df['Claim_Amount'].describe(percentiles=[0.25, 0.5, 0.75, 0.95])
+claim_p95 = claim_stats['95%']
+print(f"   Mean:       ${claim_stats['mean']:,.2f}")
+print(f"   Median:     ${claim_stats['50%']:,.2f}")
+print(f"   Std Dev:    ${claim_stats['std']:,.2f}")
+print(f"   Min:        ${claim_stats['min']:,.2f}")
+print(f"   Max:        ${claim_stats['max']:,.2f}")
+print(f"   25th pct:   ${claim_stats['25%']:,.2f}")
+print(f"   75th pct:   ${claim_stats['75%']:,.2f}")
+print(f"   95th pct:   ${claim_p95:,.2f}")
 
 print(f"\n5. ADVERSE ACTIONS DISTRIBUTION:")
 adverse_dist = df['Adverse_Actions'].value_counts()
-for action, count in adverse_dist.items():
-    print(f"   {action:20s}: {count:8,} ({count/len(df)*100:5.2f}%)")
+report(adverse_dist, len(df))
 
 print(f"\n6. BOARD CERTIFICATION:")
 cert_dist = df['Board_Certification'].value_counts()
-for cert, count in cert_dist.items():
-    print(f"   {cert:20s}: {count:8,} ({count/len(df)*100:5.2f}%)")
+report(cert_dist, len(df))
 
 print(f"\n7. REASSIGNMENT OF BENEFITS:")
 reassign_dist = df['Reassignment_Of_Benefits'].value_counts()
-for r, count in reassign_dist.items():
-    print(f"   {r:20s}: {count:8,} ({count/len(df)*100:5.2f}%)")
+report(reassign_dist, len(df))
 
 print(f"\n8. TOP 10 LICENSE STATES:")
 state_dist = df['License_State'].value_counts().head(10)
-for state, count in state_dist.items():
-    print(f"   {state:5s}: {count:8,} ({count/len(df)*100:5.2f}%)")
+report(state_dist, len(df), width=5)
 
 print(f"\n9. TOP 10 SPECIALTY CODES:")
 specialty_dist = df['Specialty_Code'].value_counts().head(10)
-for spec, count in specialty_dist.items():
-    print(f"   {str(spec):5}: {count:8,} ({count/len(df)*100:5.2f}%)")
+report(specialty_dist, len(df), width=5)
 
 print(f"\n10. BILLING AGENCY:")
 has_billing = df['Billing_Agency'].notna().sum()
@@ -67,25 +95,31 @@ print(f"   Has Billing Agency:  {has_billing:8,} ({has_billing/len(df)*100:5.2f}
 print(f"   No Billing Agency:   {no_billing:8,} ({no_billing/len(df)*100:5.2f}%)")
 
 print(f"\n11. DUPLICATE ANALYSIS:")
-ssn_dups = df[df['SSN'].notna()].duplicated(subset=['SSN'], keep=False).sum()
-ein_dups = df[df['ssn_ein'].notna()].duplicated(subset=['ssn_ein'], keep=False).sum()
-bank_dups = df.duplicated(subset=['BANK'], keep=False).sum()
+# Each duplicate mask is built once, aligned to the full index, and reused by the fraud labels
+ssn_present = df['SSN'].notna()
+ssn_dups_mask = df.loc[ssn_present, 'SSN'].duplicated(keep=False).reindex(df.index, fill_value=False)
+ein_present = df['ssn_ein'].notna()
+ein_dups_mask = df.loc[ein_present, 'ssn_ein'].duplicated(keep=False).reindex(df.index, fill_value=False)
+bank_dups_mask = df['BANK'].duplicated(keep=False)
+ssn_dups = ssn_dups_mask.sum()
+ein_dups = ein_dups_mask.sum()
+bank_dups = bank_dups_mask.sum()
 print(f"   Duplicate SSN:       {ssn_dups:8,} ({ssn_dups/len(df)*100:5.2f}%)")
 print(f"   Duplicate EIN:       {ein_dups:8,} ({ein_dups/len(df)*100:5.2f}%)")
 print(f"   Shared Bank Accts:   {bank_dups:8,} ({bank_dups/len(df)*100:5.2f}%)")
 
-# Create fraud labels
-fraud_indicators = []
-fraud_indicators.append(df['Risk_Score'] > 10)
-fraud_indicators.append(df['Adverse_Actions'].isin(['Malpractice', 'Suspension']))
-ssn_dups_mask = df[df['SSN'].notna()].duplicated(subset=['SSN'], keep=False)
-ein_dups_mask = df[df['ssn_ein'].notna()].duplicated(subset=['ssn_ein'], keep=False)
-fraud_indicators.append(ssn_dups_mask | ein_dups_mask)
-bank_dups_mask = df.duplicated(subset=['BANK'], keep=False)
-fraud_indicators.append(bank_dups_mask)
-high_claims = df['Claim_Amount'] > df['Claim_Amount'].quantile(0.95)
-fraud_indicators.append(high_claims)
-is_fraud = np.logical_or.reduce(fraud_indicators).astype(int)
+# Create fraud labels by OR-ing each indicator into a single boolean buffer
+high_risk = df['Risk_Score'].to_numpy() > 10
+adverse = df['Adverse_Actions'].isin(['Malpractice', 'Suspension']).to_numpy()
+id_dups = (ssn_dups_mask | ein_dups_mask).to_numpy()
+high_claims = df['Claim_Amount'].to_numpy() > claim_p95
+
+is_fraud = np.zeros(len(df), dtype=bool)
+is_fraud |= high_risk
+is_fraud |= adverse
+is_fraud |= id_dups
+is_fraud |= bank_dups_mask.to_numpy()
+is_fraud |= high_claims
 
 print(f"\n12. FRAUD LABEL DISTRIBUTION (Based on indicators):")
 fraud_count = is_fraud.sum()
@@ -94,30 +128,31 @@ print(f"   Fraudulent:          {fraud_count:8,} ({fraud_count/len(df)*100:5.2f}
 print(f"   Legitimate:          {legit_count:8,} ({legit_count/len(df)*100:5.2f}%)")
 
 print(f"\n   Fraud Breakdown by Indicator:")
-print(f"   - High Risk Score (>10):     {(df['Risk_Score'] > 10).sum():8,}")
-print(f"   - Adverse Actions:           {df['Adverse_Actions'].isin(['Malpractice', 'Suspension']).sum():8,}")
-print(f"   - Duplicate SSN/EIN:         {(ssn_dups_mask | ein_dups_mask).sum():8,}")
+print(f"   - High Risk Score (>10):     {high_risk.sum():8,}")
+print(f"   - Adverse Actions:           {adverse.sum():8,}")
+print(f"   - Duplicate SSN/EIN:         {id_dups.sum():8,}")
 print(f"   - Shared Bank Accounts:      {bank_dups_mask.sum():8,}")
 print(f"   - High Claims (top 5%):      {high_claims.sum():8,}")
 
 print(f"\n13. ENROLLMENT DATE RANGE:")
-enrollment_dates = pd.to_datetime(df['Enrollment_Date'])
+enrollment_dates = pd.to_datetime(df['Enrollment_Date'], format='%m/%d/%Y')  # the generator writes MM/DD/YYYY strings
 print(f"   Earliest: {enrollment_dates.min()}")
 print(f"   Latest:   {enrollment_dates.max()}")
 print(f"   Span:     {(enrollment_dates.max() - enrollment_dates.min()).days} days ({(enrollment_dates.max() - enrollment_dates.min()).days/365:.1f} years)")
 
+# One grouping by provider type serves both the gender and ownership breakdowns
+by_ptype = df.groupby('Provider_Type', observed=True)
+
 print(f"\n14. GENDER DISTRIBUTION (Individuals only):")
-gender_dist = df[df['Provider_Type'] == 'Individual']['Gender'].value_counts()
-ind_total = len(df[df['Provider_Type'] == 'Individual'])
-for gender, count in gender_dist.items():
-    print(f"   {gender:20s}: {count:8,} ({count/ind_total*100:5.2f}%)")
+gender_dist = by_ptype['Gender'].value_counts().get('Individual', pd.Series(dtype=int))
+ind_total = provider_dist.get('Individual', 0)
+report(gender_dist, ind_total)
 
 print(f"\n15. OWNERSHIP TYPE DISTRIBUTION (Organizations only):")
 if 'Ownership_Type' in df.columns:
-    owner_dist = df[df['Provider_Type'] == 'Organization']['Ownership_Type'].value_counts()
-    org_total = len(df[df['Provider_Type'] == 'Organization'])
-    for owner, count in owner_dist.items():
-        print(f"   {owner:20s}: {count:8,} ({count/org_total*100:5.2f}%)")
+    owner_dist = by_ptype['Ownership_Type'].value_counts().get('Organization', pd.Series(dtype=int))
+    org_total = provider_dist.get('Organization', 0)
+    report(owner_dist, org_total)
 
 print(f"\n16. UNIQUE VALUES:")
 print(f"   Unique Banks:        {df['BANK'].nunique():8,}")
@@ -4,55 +4,55 @@ Unified Healthcare Data Generator
 Combines NPI generation and synthetic healthcare claims data generation
 """
 
-import csv
-import random
-import string
-from datetime import date, datetime, timedelta
+import os
+from multiprocessing import Pool
+from datetime import date
 import numpy as np
 import pandas as pd
 from faker import Faker
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
+
+try:
+    from numba import njit
+except ImportError:  # run the batch helpers as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pandas writers are used as the fallback (Parquet via fastparquet)
+    pa = None
 
 # ============================================================================ #
 # ---------------------------- NPI FILLER ------------------------------------ #
 # ============================================================================ #
 
 class NPISequence:
-    """Iterator for NPI numbers from a reference CSV file"""
+    """Sequential NPI numbers from a reference CSV file or an in-memory array"""
 
-    def __init__(self, csv_path, start=0, end=None):
-        self.npi_list = []
-        with open(csv_path, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                self.npi_list.append(row['NPI'])
+    def __init__(self, source, start=0, end=None):
+        if isinstance(source, str):
+            self.npi_arr = pd.read_csv(source, usecols=['NPI'], dtype=str)['NPI'].to_numpy()
+        else:
+            self.npi_arr = np.asarray(source)
 
-        if end is None or end > len(self.npi_list):
-            end = len(self.npi_list)
+        if end is None or end > len(self.npi_arr):
+            end = len(self.npi_arr)
 
         self.start = start
         self.end = end
         self.index = self.start
         self.total = self.end - self.start
 
-    def next(self):
-        if self.index >= self.end:
-            raise IndexError(f"Ran out of NPIs in reference_npi_list.csv for the specified range!")
-        npi = self.npi_list[self.index]
-        self.index += 1
-        return npi
-
-
-# Create a global NPI sequence object with default full range
-npi_seq = None
-
-
-def fill_npi(start=0, end=None):
-    """Get next NPI from the sequence"""
-    global npi_seq
-    if npi_seq is None or npi_seq.start != start or npi_seq.end != (end if end is not None else len(npi_seq.npi_list)):
-        npi_seq = NPISequence('./output/reference_npi_list.csv', start, end)
-    return npi_seq.next()
+    def take(self, n):
+        """Return the next n NPIs as an array slice"""
+        if self.index + n > self.end:
+            raise IndexError(f"Ran out of NPIs: {n} requested, {self.end - self.index} left in the specified range!")
+        npis = self.npi_arr[self.index:self.index + n]
+        self.index += n
+        return npis
 
 
 def luhn_checksum(num_str: str) -> str:
@@ -69,17 +69,18 @@ def luhn_checksum(num_str: str) -> str:
     return str((10 - (total % 10)) % 10)
 
 
-def generate_unique_prefixed_numbers(num_to_generate, prefix, length=10):
+def generate_unique_prefixed_numbers(rng, num_to_generate, prefix, length=10):
     """
     Generate a set of unique numbers as strings, each with a specified prefix and total length.
 
     Args:
-        num_hashes (int): Number of unique numbers to generate.
+        rng (np.random.Generator): Source of randomness.
+        num_to_generate (int): Number of unique numbers to generate.
         prefix (int or str): The starting digits of each number.
         length (int): Total length of each number (default is 10).
 
     Returns:
-        list: List of unique numbers as strings.
+        np.ndarray: Array of unique numbers as strings, in random order.
     """
     prefix_str = str(prefix)
     if len(prefix_str) >= length:
@@ -92,121 +93,271 @@ def generate_unique_prefixed_numbers(num_to_generate, prefix, length=10):
     if num_to_generate > (max_value - min_value + 1):
         raise ValueError("Requested more numbers than possible with the given length and prefix.")
 
-    hashes = set()
-
-    while len(hashes) < num_to_generate:
-        suffix = str(random.randint(min_value, max_value)).zfill(num_digits)
-        hashes.add(prefix_str + suffix)
-
-    return list(hashes)
-
-
-def generate_npi():
-    """Generate a valid NPI number (commented out for now)"""
-    # base = ''.join(random.choices(string.digits, k=9))
-    # return base + luhn_checksum(base)
-    pass
+    # Draw oversized batches and dedupe in NumPy until enough unique suffixes exist
+    suffixes = np.empty(0, dtype=np.int64)
+    while len(suffixes) < num_to_generate:
+        batch = rng.integers(min_value, max_value + 1, size=num_to_generate*2, dtype=np.int64)
+        suffixes = np.unique(np.concatenate([suffixes, batch]))
+
+    # np.unique sorts, so shuffle before trimming to keep the sample uniform
+    suffixes = rng.permutation(suffixes)[:num_to_generate]
+    return np.char.add(prefix_str, suffixes.astype(str))
+
+
+@njit(cache=True)
+def luhn_checksum_batch(digits):
+    """Compute Luhn check digits for an (N, width) uint8 array of digits."""
+    n, width = digits.shape
+    parity = width % 2
+    checks = np.empty(n, dtype=np.uint8)
+    for row in range(n):
+        total = 0
+        for i in range(width):
+            d = int(digits[row, i])
+            if i % 2 == parity:
+                d *= 2
+                if d > 9:
+                    d -= 9
+            total += d
+        checks[row] = (10 - (total % 10)) % 10
+    return checks
+
+
+def generate_npi(rng, size):
+    """Generate an array of valid NPI numbers"""
+    digits = np.empty((size, 10), dtype=np.uint8)
+    digits[:, :9] = rng.integers(0, 10, size=(size, 9), dtype=np.uint8)
+    digits[:, 9] = luhn_checksum_batch(digits[:, :9])
+    return (digits + ord("0")).view("S10").ravel().astype(str)
 
 
 # ============================================================================ #
 # ----------------------- HELPER FUNCTIONS ----------------------------------- #
 # ============================================================================ #
 
-def generate_ssn():
-    """Generate a random SSN"""
-    return f"{random.randint(100, 899):03d}-{random.randint(10, 99):02d}-{random.randint(1000, 9999):04d}"
-
-
-def generate_ein():
-    """Generate a random EIN"""
-    return f"{random.randint(10, 99):02d}-{random.randint(1000000, 9999999):07d}"
-
-
-def random_date(start_year=1930, end_year=2000):
-    """Generate a random date of birth"""
-    start = date(start_year, 1, 1)
-    end = date(end_year, 12, 31)
-    delta = (end - start).days
-    return start + timedelta(days=random.randint(0, delta))
-
-
-def future_date(years_ahead=5):
-    """Generate a future date"""
-    today = date.today()
-    return today + timedelta(days=random.randint(30, 365*years_ahead))
-
-
-def generate_state_license(state_abbr):
-    """Generate a state license number"""
-    return f"{state_abbr}{random.randint(100000, 999999):06d}"
-
-
-def generate_dea_number():
-    """Generate DEA number"""
-    letters = ''.join(random.choices(string.ascii_uppercase, k=2))
-    digits = ''.join(random.choices(string.digits, k=7))
-    return letters + digits
-
+def join_columns(*columns, sep=""):
+    """Concatenate string arrays element-wise"""
+    out = np.asarray(columns[0]).astype(str)
+    for col in columns[1:]:
+        if sep:
+            out = np.char.add(out, sep)
+        out = np.char.add(out, np.asarray(col).astype(str))
+    return out
+
+
+def random_digit_chars(rng, size, width, first_low=0, first_high=9):
+    """Return a (size, width) uint8 array of ASCII digits, the first in [first_low, first_high]"""
+    digits = rng.integers(0, 10, size=(size, width), dtype=np.uint8)
+    digits[:, 0] = rng.integers(first_low, first_high + 1, size=size)
+    return digits + np.uint8(ord("0"))
+
+
+def chars_to_str(*blocks):
+    """Join uint8 character blocks and literal separators column-wise into strings"""
+    size = next(len(block) for block in blocks if not isinstance(block, str))
+    parts = [np.tile(np.frombuffer(block.encode(), dtype=np.uint8), (size, 1)) if isinstance(block, str) else block
+             for block in blocks]
+    chars = np.hstack(parts)
+    # trailing NUL bytes are dropped by the fixed-width bytes dtype
+    return chars.view(f"S{chars.shape[1]}").ravel().astype(str)
+
+
+def format_dates(dates):
+    """Format a datetime64 array as MM/DD/YYYY strings"""
+    # Reorder the characters of the ISO YYYY-MM-DD form instead of calling strftime per row
+    iso = np.datetime_as_string(np.asarray(dates, dtype="datetime64[D]"), unit="D")
+    chars = iso.astype("U10").view(np.uint32).reshape(-1, 10)[:, [5, 6, 4, 8, 9, 4, 0, 1, 2, 3]]
+    chars[:, [2, 5]] = ord("/")
+    return np.ascontiguousarray(chars).view("U10").ravel()
+
+
+def generate_ssn(rng, size):
+    """Generate an array of random SSNs"""
+    return chars_to_str(random_digit_chars(rng, size, 3, first_low=1, first_high=8),
+                        "-", random_digit_chars(rng, size, 2, first_low=1),
+                        "-", random_digit_chars(rng, size, 4, first_low=1))
+
+
+def generate_ein(rng, size):
+    """Generate an array of random EINs"""
+    return chars_to_str(random_digit_chars(rng, size, 2, first_low=1),
+                        "-", random_digit_chars(rng, size, 7, first_low=1))
+
+
+def random_date(rng, start_year=1930, end_year=2000, size=None):
+    """Generate an array of random dates of birth"""
+    start = np.datetime64(date(start_year, 1, 1), "D")
+    end = np.datetime64(date(end_year, 12, 31), "D")
+    delta = (end - start).astype(int)
+    return start + rng.integers(0, delta + 1, size=size).astype("timedelta64[D]")
+
+
+def future_date(rng, years_ahead=5, size=None):
+    """Generate an array of future dates"""
+    today = np.datetime64(date.today(), "D")
+    return today + rng.integers(30, 365*years_ahead + 1, size=size).astype("timedelta64[D]")
+
+
+def generate_state_license(rng, state_abbr):
+    """Generate state license numbers for an array of state abbreviations"""
+    return join_columns(state_abbr, chars_to_str(random_digit_chars(rng, len(state_abbr), 6, first_low=1)))
+
+
+def generate_dea_number(rng, size):
+    """Generate an array of DEA numbers"""
+    letters = rng.integers(ord("A"), ord("Z") + 1, size=(size, 2)).astype(np.uint8)
+    return chars_to_str(letters, random_digit_chars(rng, size, 7))
+
+
+def generate_digit_strings(rng, lengths):
+    """Generate random digit strings with the given per-row lengths"""
+    lengths = np.asarray(lengths)
+    if len(lengths) == 0:
+        return np.empty(0, dtype=str)
+    chars = random_digit_chars(rng, len(lengths), int(lengths.max()))
+    chars[np.arange(chars.shape[1]) >= lengths[:, None]] = 0
+    return chars_to_str(chars)
+
+
+class OutputWriter:
+    """Stream generated chunks to the CSV output and its Parquet copy"""
+
+    def __init__(self, csv_path, parquet_path):
+        self.csv_path = csv_path
+        self.parquet_path = parquet_path
+        self.fast_io = FAST_IO and pa is not None
+        self.schema = None
+        self.csv_writer = None
+        self.parquet_writer = None
+        self.rows = 0
+
+    def write(self, df):
+        encoded = df.astype({col: "category" for col in CATEGORICAL_COLUMNS})
+        if pa is not None:
+            if self.schema is None:
+                self.schema = pa.Schema.from_pandas(encoded, preserve_index=False)
+                self.parquet_writer = pq.ParquetWriter(self.parquet_path, self.schema, compression="snappy")
+            table = pa.Table.from_pandas(encoded, schema=self.schema, preserve_index=False)
+            self.parquet_writer.write_table(table)
+        else:
+            encoded.to_parquet(self.parquet_path, engine="fastparquet", compression="snappy",
+                               append=self.rows > 0, index=False)
 
-def random_specialty_code():
-    """Return a random CMS specialty code"""
+        if self.fast_io:
+            if self.csv_writer is None:
+                self.csv_writer = pacsv.CSVWriter(self.csv_path, self.schema)
+            self.csv_writer.write_table(table)
+        else:
+            df.to_csv(self.csv_path, mode="w" if self.rows == 0 else "a",
+                      header=self.rows == 0, index=False)
+        self.rows += len(df)
+
+    def close(self):
+        if self.csv_writer is not None:
+            self.csv_writer.close()
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+
+def sample_donors(rng, indices, candidates):
+    """Pick a distinct donor row from candidates for each index, never one of the indices"""
+    pool = np.setdiff1d(candidates, indices)
+    # donors are only reused when there are fewer candidates than indices
+    return rng.choice(pool, size=len(indices), replace=len(pool) < len(indices))
+
+
+def sample_typed_donors(rng, indices, is_individual):
+    """Pick a donor for each index among the rows sharing its provider type"""
+    indices = np.asarray(indices)
+    individual = is_individual[indices]
+    donors = np.empty(len(indices), dtype=np.int64)
+    for mask, candidates in ((individual, np.flatnonzero(is_individual)),
+                             (~individual, np.flatnonzero(~is_individual))):
+        donors[mask] = sample_donors(rng, indices[mask], candidates)
+    return donors
+
+
+def pair_overrides(donors, targets, donor_values, target_values=None):
+    """Build row overrides for donor/target pairs; a row in several pairs keeps its last assignment"""
+    if target_values is None:
+        target_values = donor_values
+    overrides = pd.DataFrame({col: np.concatenate([donor_values[col], target_values[col]]) for col in donor_values},
+                             index=np.concatenate([donors, targets]))
+    return overrides[~overrides.index.duplicated(keep="last")].sort_index()
+
+
+def random_specialty_code(rng, size):
+    """Return an array of random CMS specialty codes"""
     # Subset of actual CMS codes
     codes = ["01", "02", "03", "06", "08", "10", "11", "20", "30"]  # Internal Med, General Surg, ...
-    return random.choice(codes)
+    return rng.choice(codes, size=size)
 
 
-def random_phone():
-    """Generate a random phone number"""
-    return f"+{random.randint(200, 999):03d}-{random.randint(100,999):03d}-{random.randint(1000,9999):04d}"
+def random_phone(rng, size):
+    """Generate an array of random phone numbers"""
+    return chars_to_str("+", random_digit_chars(rng, size, 3, first_low=2),
+                        "-", random_digit_chars(rng, size, 3, first_low=1),
+                        "-", random_digit_chars(rng, size, 4, first_low=1))
 
 
-def random_accreditation_org():
-    """Return a random accreditation organization"""
-    return random.choice(["JCAHO", "URAC", "NCQA", "DNV", None])
+def random_accreditation_org(rng, size):
+    """Return an array of random accreditation organizations"""
+    return rng.choice(np.array(["JCAHO", "URAC", "NCQA", "DNV", None], dtype=object), size=size)
 
 
-def random_ownership():
-    """Return a random ownership type"""
-    return np.random.choice(list(OWNERSHIP_TYPE_DIST.keys()),
-                           p=list(OWNERSHIP_TYPE_DIST.values()))
+def random_ownership(rng, size):
+    """Return an array of random ownership types"""
+    return rng.choice(list(OWNERSHIP_TYPE_DIST.keys()), size=size,
+                      p=list(OWNERSHIP_TYPE_DIST.values()))
 
 
-def similar_name(name):
-    """Return a slightly modified name with ≥ 90 % fuzzy similarity."""
-    if "," in name:  # Handle org names with commas
-        name = name.replace(",", "")
+def similar_name(rng, names):
+    """Return slightly modified names with ≥ 90 % fuzzy similarity."""
+    names = pd.Series(names, dtype=object).str.replace(",", "", regex=False)  # Handle org names with commas
+    tokens = names.str.split(" ", n=2, expand=True).reindex(columns=[0, 1, 2])
 
-    tokens = name.split()
-    if len(tokens) > 2 and random.random() < 0.5:
-        tokens.pop(1)  # Drop middle name/initial
-    else:
-        tokens[0] = tokens[0][0] + tokens[0]  # Duplicate first letter
+    drop_middle = tokens[2].notna().to_numpy() & (rng.random(len(names)) < 0.5)
+    dropped = tokens[0] + " " + tokens[2]  # Drop middle name/initial
+    doubled = names.str[0] + names  # Duplicate first letter
+    return np.where(drop_middle, dropped, doubled)
 
-    return " ".join(tokens)
 
+def similar_email(rng, emails):
+    """Return similar emails with fuzzy similarity"""
+    parts = pd.Series(emails, dtype=object).str.split("@", n=1, expand=True)
+    user, domain = parts[0], parts[1]
 
-def similar_email(email):
-    """Return a similar email with fuzzy similarity"""
-    user, domain = email.split("@")
-    if "." in user and random.random() < 0.5:
-        user = user.replace(".", "")
-    else:
-        user = user.replace(".", "_")
+    strip = user.str.contains(".", regex=False).to_numpy() & (rng.random(len(user)) < 0.5)
+    user = np.where(strip, user.str.replace(".", "", regex=False), user.str.replace(".", "_", regex=False))
+    return (user + "@" + domain).to_numpy()
 
-    return f"{user}@{domain}"
 
+def fuzzy_variants(rng, base, transform, attempts=10):
+    """Apply transform until each variant differs from base with ≥ 90 % similarity, else keep base."""
+    base = np.asarray(base, dtype=object)
+    variants = base.copy()
+    pending = np.arange(len(base))
+    # Try a fixed number of times to avoid infinite loops
+    for _ in range(attempts):
+        if len(pending) == 0:
+            break
+        candidates = np.asarray(transform(rng, base[pending]), dtype=object)
+        scores = process.cpdist(base[pending], candidates, scorer=fuzz.ratio)
+        ok = (scores >= 90) & (candidates != base[pending])
+        variants[pending[ok]] = candidates[ok]
+        pending = pending[~ok]
+    return variants
 
-def generate_risk_score():
-    """Return 0 with 90% probability, else a random int between 1 and 20."""
-    if random.random() < 0.1:
-        return random.randint(1, 20)
-    else:
-        return 0
 
+def generate_risk_score(rng, size):
+    """Return an array that is 0 with 90% probability, else a random int between 1 and 20."""
+    scores = rng.integers(1, 21, size=size)
+    return np.where(rng.random(size) < 0.1, scores, 0)
 
-def generate_claim_amount():
-    """Return a random claim amount between $1,000 and $10,000,000."""
-    return random.randint(1000, 10000000)
+
+def generate_claim_amount(rng, size):
+    """Return an array of random claim amounts between $1,000 and $10,000,000."""
+    return rng.integers(1000, 10000001, size=size)
 
 
 # ============================================================================ #
@@ -214,8 +365,15 @@ def generate_claim_amount():
 # ============================================================================ #
 
 TOTAL_ROWS = 1_000_000  # 1000 thousand rows
-DUPLICATE_RATE = 0.02   # 2 % of TOTAL_ROWS will receive ID duplicates
 FUZZY_DUPLICATE_RATE = 0.02  # 2 % of TOTAL_ROWS will receive fuzzy dupes
+FAST_IO = True  # write the CSV through PyArrow when available, else fall back to pandas
+CHUNK_ROWS = 100_000  # rows generated and written per batch
+POOL_SIZE = 50_000  # distinct Faker names, companies, emails and states to draw from
+WORKERS = os.cpu_count() or 1  # processes generating chunks in parallel (1 = serial)
+
+# Low-cardinality columns stored dictionary-encoded in the Parquet output
+CATEGORICAL_COLUMNS = ["Provider_Type", "Adverse_Actions", "Board_Certification", "Reassignment_Of_Benefits",
+                       "License_State", "Specialty_Code", "Ownership_Type", "Gender", "Accreditation_Org"]
 
 # Distribution knobs (must sum to 1.0)
 PROVIDER_TYPE_DIST = {
@@ -239,173 +397,187 @@ OWNERSHIP_TYPE_DIST = {
 # -------------------------- MAIN GENERATOR ---------------------------------- #
 # ============================================================================ #
 
+def build_pools(fake, rng):
+    """Prebuild the Faker-backed value pools that records draw from"""
+    return {
+        "name": np.array([fake.name() for _ in range(POOL_SIZE)], dtype=object),
+        "company": np.array([fake.company() for _ in range(POOL_SIZE)], dtype=object),
+        "email": np.array([fake.email() for _ in range(POOL_SIZE)], dtype=object),
+        "state": np.array([fake.state_abbr() for _ in range(POOL_SIZE)]),
+        "address": np.array([fake.address().replace("\n", ", ") for _ in range(10000)]),
+        "phone": random_phone(rng, 10000),
+    }
+
+
+def generate_records(rng, n, pools, npis, provider_type):
+    """Generate n provider records as a column-wise DataFrame"""
+    is_individual = (provider_type == "Individual")
+
+    name = np.where(is_individual, rng.choice(pools["name"], size=n), rng.choice(pools["company"], size=n))
+    ssn = np.where(is_individual, generate_ssn(rng, n), None)
+    ein = np.where(is_individual, None, generate_ein(rng, n))
+    dob = np.where(is_individual, format_dates(random_date(rng, size=n)), None)
+    gender = np.where(is_individual, rng.choice(["Male", "Female"], size=n), None)
+
+    # contact & license
+    contact_email = rng.choice(pools["email"], size=n)
+    license_state = rng.choice(pools["state"], size=n)
+    license_num = generate_state_license(rng, license_state)
+
+    # generate account + routing
+    account = generate_digit_strings(rng, rng.integers(8, 13, size=n))
+    routing = generate_digit_strings(rng, np.full(n, 9))
+
+    billing_mask = rng.random(n) < 0.5
+    billing_agency = np.where(billing_mask, rng.choice(pools["company"], size=n), None)
+
+    return pd.DataFrame({
+        "NPI": npis,
+        "Provider_Type": provider_type,
+        "Provider_Name": name,
+        "SSN": ssn,
+        "ssn_ein": ein,
+        "Contact_Email": contact_email,
+        "DOB": dob,
+        "Gender": gender,
+        "Contact_Phone": rng.choice(pools["phone"], size=n),
+        "Practice_Address": rng.choice(pools["address"], size=n),
+        "Mailing_Address": rng.choice(pools["address"], size=n),
+        "State_License_Number": license_num,
+        "License_State": license_state,
+        "License_Expiration": format_dates(future_date(rng, 6, size=n)),
+        "DEA_Number": np.where(is_individual, generate_dea_number(rng, n), None),
+        "Specialty_Code": random_specialty_code(rng, n),
+        "Board_Certification": rng.choice(["Yes", "No"], size=n,
+                                          p=list(BOARD_CERT_DIST.values())),
+        "Accreditation_Org": random_accreditation_org(rng, n),
+        "Accreditation_Exp": format_dates(future_date(rng, 6, size=n)),
+        "Ownership_Type": random_ownership(rng, n),
+        "Adverse_Actions": rng.choice(["None"]*9 + ["Malpractice", "Suspension"], size=n),
+        "Bank_Account_Number": account,
+        "Bank_Routing_Number": routing,
+        "BANK": join_columns(account, routing, sep="-"),
+        "Billing_Agency": billing_agency,
+        "Reassignment_Of_Benefits": rng.choice(["Y", "N"], size=n),
+        "Enrollment_Date": format_dates(random_date(rng, 2005, 2023, size=n)),
+        "Last_Updated": date.today().strftime("%m/%d/%Y"),
+        "Risk_Score": generate_risk_score(rng, n),
+        "Claim_Amount": generate_claim_amount(rng, n)
+    })
+
+
+# Value pools shared with chunk worker processes
+worker_pools = None
+
+
+def init_worker(pools):
+    """Pool initializer: keep the value pools in the worker instead of pickling them per chunk"""
+    global worker_pools
+    worker_pools = pools
+
+
+def generate_chunk(task):
+    """Generate one chunk from its own generator and a contiguous slice of the NPIs"""
+    rng, npis, provider_type = task
+    return generate_records(rng, len(npis), worker_pools, npis, provider_type)
+
+
+def apply_overrides(chunk, start, overrides):
+    """Overwrite the chunk rows whose global index (start + position) appears in each override frame"""
+    for frame in overrides:
+        rows = frame.loc[start:start + len(chunk) - 1]
+        if len(rows):
+            chunk.loc[rows.index - start, rows.columns] = rows.to_numpy()
+
+
 def main():
     """Main data generation function"""
 
-    # Initialize Faker
+    # One seeded PCG64 generator drives every draw; Faker is seeded from it
+    rng = np.random.default_rng(42)
     fake = Faker()
-    Faker.seed(42)
-    random.seed(42)
-    np.random.seed(42)
+    Faker.seed(int(rng.integers(2**32)))
 
     # Generate reference NPI list first
     print("Generating reference NPI list...")
-    reference_npi_list = generate_unique_prefixed_numbers(1000000, 2, length=10)
+    reference_npi_list = generate_unique_prefixed_numbers(rng, 1000000, 2, length=10)
     print(f"Generated {len(reference_npi_list)} NPIs with prefix '2' and length 10.")
 
     # Write the reference_npi_list to a CSV file
-    with open('./output/reference_npi_list.csv', 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(['NPI'])
-        for npi in reference_npi_list:
-            writer.writerow([npi])
+    pd.Series(reference_npi_list, name='NPI').to_csv('./output/reference_npi_list.csv', index=False)
 
     print(f"Wrote {len(reference_npi_list)} NPIs to reference_npi_list.csv")
 
+    # Faker runs once per pool entry instead of once per row
+    pools = build_pools(fake, rng)
+
     # -------------------------------------------------------- #
-    # ---------------- ID DUPLICATIONS ----------------------- #
+    # ---------------- FUZZY DUPLICATIONS -------------------- #
     # -------------------------------------------------------- #
 
-    # Precompute donor indices for efficiency
-    fuzzy_dup_count = int(TOTAL_ROWS * FUZZY_DUPLICATE_RATE)
-    fuzzy_indices = random.sample(list(range(TOTAL_ROWS)), fuzzy_dup_count)
-
-    donor_indices = []
-    for idx in fuzzy_indices:
-        # Avoid picking the same index
-        donor_idx = random.choice([x for x in range(TOTAL_ROWS) if x != idx])
-        donor_indices.append(donor_idx)
-
-    # Vectorized update using zip for efficiency
-    for idx, donor_idx in zip(fuzzy_indices, donor_indices):
-        base_name = fake.name()  # Will be replaced later
-        base_email = fake.email()
-
-        # Try a fixed number of times to avoid infinite loops
-        for _ in range(10):
-            new_name = similar_name(base_name)
-            if fuzz.ratio(base_name, new_name) >= 90 and new_name != base_name:
-                break
-        else:
-            new_name = base_name  # fallback
-
-        for _ in range(10):
-            new_email = similar_email(base_email)
-            if fuzz.ratio(base_email, new_email) >= 90 and new_email != base_email:
-                break
-        else:
-            new_email = base_email  # fallback
-
-    # Now includes the combined BANK column
-    dup_fields_choices = ["SSN", "ssn_ein", "State_License_Number", "BANK"]
+    # Provider types are drawn up front so fuzzy duplicates can be paired by type
+    provider_types = rng.choice(list(PROVIDER_TYPE_DIST.keys()), size=TOTAL_ROWS,
+                                p=list(PROVIDER_TYPE_DIST.values()))
+    is_individual = (provider_types == "Individual")
 
-    dup_count = int(TOTAL_ROWS * DUPLICATE_RATE)
-    dup_indices = random.sample(list(range(TOTAL_ROWS)), dup_count)
+    # Fuzzy pairs share a provider type: person names for individuals, companies for organizations
+    fuzzy_dup_count = int(TOTAL_ROWS * FUZZY_DUPLICATE_RATE)
+    fuzzy_indices = rng.choice(TOTAL_ROWS, size=fuzzy_dup_count, replace=False)
+    fuzzy_individual = is_individual[fuzzy_indices]
+    donor_indices = sample_typed_donors(rng, fuzzy_indices, is_individual)
 
-    donor_indices = []
-    for idx in dup_indices:
-        # pick a random donor different from idx
-        donor_idx = random.choice([x for x in range(TOTAL_ROWS) if x != idx])
-        donor_indices.append(donor_idx)
-        field = random.choice(dup_fields_choices)
+    base_names = np.where(fuzzy_individual, rng.choice(pools["name"], size=fuzzy_dup_count),
+                          rng.choice(pools["company"], size=fuzzy_dup_count))
+    base_emails = rng.choice(pools["email"], size=fuzzy_dup_count)
+    new_names = fuzzy_variants(rng, base_names, similar_name)
+    new_emails = fuzzy_variants(rng, base_emails, similar_email)
 
-        if field == "BANK":
-            # copy the two underlying fields
-            pass  # Will be handled in record creation
-        else:
-            # Only copy if donor has a non-null value (e.g., EIN for orgs)
-            pass  # Will be handled in record creation
+    # Donor rows get the base values and the chosen rows the near-duplicates
+    overrides = [pair_overrides(donor_indices, fuzzy_indices,
+                                {"Provider_Name": base_names, "Contact_Email": base_emails},
+                                {"Provider_Name": new_names, "Contact_Email": new_emails})]
 
     # -------------------------------------------------------- #
     # --------------- GENERATE RECORDS ----------------------- #
     # -------------------------------------------------------- #
 
-    address_pool = [fake.address().replace("\n", ", ") for _ in range(10000)]
-    phone_pool = [f"+{random.randint(200, 999):03d}-{random.randint(100,999):03d}-{random.randint(1000,9999):04d}" for _ in range(10000)]
-
-    fake = Faker()
-
-    records = []
-
-    for i in range(TOTAL_ROWS):
-        provider_type = np.random.choice(list(PROVIDER_TYPE_DIST.keys()),
-                                        p=list(PROVIDER_TYPE_DIST.values()))
-        is_individual = (provider_type == "Individual")
-
-        if is_individual:
-            name = fake.name()
-            ssn = generate_ssn()
-            ein = None
-            dob = random_date()
-            gender = random.choice(["Male", "Female"])
+    # Records are written chunk by chunk so the full dataset is never held in memory
+    output_file = "./output/synthetic_data_v1.csv"
+    parquet_file = "./output/synthetic_data_v1.parquet"
+    # Each chunk gets an independent child generator, so output does not depend on WORKERS
+    starts = range(0, TOTAL_ROWS, CHUNK_ROWS)
+    npi_col = NPISequence(reference_npi_list).take(TOTAL_ROWS)
+    tasks = [(chunk_rng, npi_col[start:start + CHUNK_ROWS], provider_types[start:start + CHUNK_ROWS])
+             for chunk_rng, start in zip(rng.spawn(len(starts)), starts)]
+
+    writer = OutputWriter(output_file, parquet_file)
+    try:
+        if WORKERS > 1:
+            with Pool(WORKERS, initializer=init_worker, initargs=(pools,)) as pool:
+                chunks = pool.imap(generate_chunk, tasks)
+                for start, chunk in zip(starts, chunks):
+                    apply_overrides(chunk, start, overrides)
+                    writer.write(chunk)
         else:
-            name = fake.company()
-            ssn = None
-            ein = generate_ein()
-            dob = None
-            gender = None
-
-        # contact & license
-        contact_email = fake.email()
-        license_state = fake.state_abbr()
-        license_num = generate_state_license(license_state)
-
-        # generate account + routing
-        account = ''.join(random.choices(string.digits, k=random.randint(8,12)))
-        routing = ''.join(random.choices(string.digits, k=9))
-
-        record = {
-            "NPI": fill_npi(),
-            "Provider_Type": provider_type,
-            "Provider_Name": name,
-            "SSN": ssn,
-            "ssn_ein": ein,
-            "Contact_Email": contact_email,
-            "DOB": dob.strftime("%m/%d/%Y") if dob else None,
-            "Gender": gender,
-            "Contact_Phone": random.choice(phone_pool),
-            "Practice_Address": random.choice(address_pool),
-            "Mailing_Address": random.choice(address_pool),
-            "State_License_Number": license_num,
-            "License_State": license_state,
-            "License_Expiration": future_date(6).strftime("%m/%d/%Y"),
-            "DEA_Number": generate_dea_number() if is_individual else None,
-            "Specialty_Code": random_specialty_code(),
-            "Board_Certification": np.random.choice(["Yes", "No"],
-                                                    p=list(BOARD_CERT_DIST.values())),
-            "Accreditation_Org": random_accreditation_org(),
-            "Accreditation_Exp": future_date(6).strftime("%m/%d/%Y"),
-            "Ownership_Type": random_ownership(),
-            "Adverse_Actions": random.choice(["None"]*9 + ["Malpractice", "Suspension"]),
-            "Bank_Account_Number": account,
-            "Bank_Routing_Number": routing,
-            "BANK": f"{account}-{routing}",
-            "Billing_Agency": random.choice([fake.company(), None]),
-            "Reassignment_Of_Benefits": random.choice(["Y","N"]),
-            "Enrollment_Date": random_date(2005, 2023).strftime("%m/%d/%Y"),
-            "Last_Updated": date.today().strftime("%m/%d/%Y"),
-            "Risk_Score": generate_risk_score(),
-            "Claim_Amount": generate_claim_amount()
-        }
-        records.append(record)
-
-    df = pd.DataFrame(records)
+            init_worker(pools)
+            for start, task in zip(starts, tasks):
+                chunk = generate_chunk(task)
+                apply_overrides(chunk, start, overrides)
+                writer.write(chunk)
+    finally:
+        writer.close()
+
+    preview = pd.read_csv(output_file, nrows=5)
 
     # COMMAND ----------
     print(f"\nDataframe info:")
-    print(df.info())
+    print(preview.info())
 
     # COMMAND ----------
     print(f"\nDataframe head:")
-    print(df.head())
+    print(preview.head())
 
-    # -------------------------------------------------------- #
-    # --------------- OUTPUT --------------------------------- #
-    # -------------------------------------------------------- #
-
-    output_file = "./output/synthetic_data_v1.csv"
-    df.to_csv(output_file, index=False)
-    print(f"\nSynthetic data set generated: {output_file}")
+    print(f"\nSynthetic data set generated: {output_file} (Parquet copy: {parquet_file})")
 
 
 if __name__ == "__main__":